@@ -29,4 +29,6 @@ $(if $(PROTOBUF_MINOR_VERSION),,$(error "Protobuf minor version is not specified
 PROTOBUF_CFLAGS			+= -DPB_ENABLE_MALLOC
 
 CFLAGS				+= -I$(ASSETS_COMPILED_DIR) $(PROTOBUF_CFLAGS)
+# assets_icons.c pulls icon frames from assets_icons.bin with .incbin
+CFLAGS				+= -Wa,-I$(ASSETS_COMPILED_DIR)
 C_SOURCES			+= $(wildcard $(ASSETS_COMPILED_DIR)/*.c)
@@ -4,12 +4,26 @@ from flipper.app import App
 
 import logging
 import argparse
-import subprocess
-import io
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
 
-ICONS_SUPPORTED_FORMATS = ["png"]
+import heatshrink2
+import PIL
+from PIL import Image
+
+# Lower case suffixes, file names are lowered before str.endswith check
+ICONS_SUPPORTED_FORMATS = (".png",)
+
+# Frames this small are stored raw, none of the current icons up to this size
+# gets smaller with heatshrink
+ICONS_MIN_COMPRESS_BYTES = 15
+
+# Bump on any change to frame conversion or encoding, invalidates icons cache
+ICONS_CACHE_VERSION = "3:heatshrink-w8-l4"
+ICONS_CACHE_FILENAME = ".icons_cache.json"
 
 ICONS_TEMPLATE_H_HEADER = """#pragma once
 #include <gui/icon.h>
@@ -17,16 +31,84 @@ ICONS_TEMPLATE_H_HEADER = """#pragma once
 """
 ICONS_TEMPLATE_H_ICON_NAME = "extern const Icon {name};\n"
 
+# Frame data goes to binary blob, assembler pulls it in with .incbin
+ICONS_BLOB_FILENAME = "assets_icons.bin"
+ICONS_BLOB_SYMBOL = "_assets_icons_blob"
+# Frames are read through FuriHalCompressHeader, keep them aligned
+ICONS_BLOB_ALIGN = 4
+
+# Blob hash makes the source change with the blob, make doesn't track .incbin
 ICONS_TEMPLATE_C_HEADER = """#include \"assets_icons.h\"
 
 #include <gui/icon_i.h>
 
+__asm__(
+    "/* {filename} sha256: {blob_hash} */\\n"
+    ".section .rodata.{symbol},\\"a\\",%progbits\\n"
+    ".balign {align}\\n"
+    ".global {symbol}\\n"
+    "{symbol}:\\n"
+    ".incbin \\"{filename}\\"\\n"
+    ".previous\\n");
+extern const uint8_t {symbol}[];
+
 """
-ICONS_TEMPLATE_C_FRAME = "const uint8_t {name}[] = {data};\n"
 ICONS_TEMPLATE_C_DATA = "const uint8_t* const {name}[] = {data};\n"
 ICONS_TEMPLATE_C_ICONS = "const Icon {name} = {{.width={width},.height={height},.frame_count={frame_count},.frame_rate={frame_rate},.frames=_{name}}};\n"
 
 
+# Hot path versions of the templates above, f-strings skip format spec parsing
+def _fmt_icon_name(name):
+    return f"extern const Icon {name};\n"
+
+
+def _fmt_data(name, data):
+    return f"const uint8_t* const {name}[] = {data};\n"
+
+
+def _fmt_icon(name, width, height, frame_rate, frame_count):
+    return f"const Icon {name} = {{.width={width},.height={height},.frame_count={frame_count},.frame_rate={frame_rate},.frames=_{name}}};\n"
+
+
+def _walk_scandir(root):
+    # Top-down like os.walk, yields directory path and its sorted file entries
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    yield root, [entry for entry in entries if not entry.is_dir(follow_symlinks=False)]
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_scandir(entry.path)
+
+
+def _png_to_xbm_bytes(file):
+    # Threshold to 1bpp without dithering, pack as XBM: ink bit set, LSB first
+    image = Image.open(file).convert("1", dither=Image.NONE)
+    width, height = image.size
+    return width, height, bytearray(image.tobytes("raw", "1;IR"))
+
+
+def _icon2frame(file):
+    width, height, data_bin = _png_to_xbm_bytes(file)
+    # Encode icon data with LZSS
+    data_enc = None
+    if len(data_bin) > ICONS_MIN_COMPRESS_BYTES:
+        data_enc_bytes = heatshrink2.compress(
+            bytes(data_bin), window_sz2=8, lookahead_sz2=4
+        )
+        assert data_enc_bytes
+        data_enc = (
+            bytes([len(data_enc_bytes) & 0xFF, len(data_enc_bytes) >> 8])
+            + data_enc_bytes
+        )
+    # Use encoded data only if its lenght less than original, including header
+    if data_enc is not None and len(data_enc) < len(data_bin) + 1:
+        data = b"\x01\x00" + data_enc
+    else:
+        data = b"\x00" + data_bin
+    # Hex string keeps frame data json serializable for icons cache
+    return width, height, data.hex()
+
+
 class Main(App):
     def init(self):
         # command args
@@ -69,127 +151,112 @@ class Main(App):
         )
         self.parser_dolphin.set_defaults(func=self.dolphin)
 
-    def _icon2header(self, file):
-        output = subprocess.check_output(["convert", file, "xbm:-"])
-        assert output
-        f = io.StringIO(output.decode().strip())
-        width = int(f.readline().strip().split(" ")[2])
-        height = int(f.readline().strip().split(" ")[2])
-        data = f.read().strip().replace("\n", "").replace(" ", "").split("=")[1][:-1]
-        data_bin_str = data[1:-1].replace(",", " ").replace("0x", "")
-        data_bin = bytearray.fromhex(data_bin_str)
-        # Encode icon data with LZSS
-        data_encoded_str = subprocess.check_output(
-            ["heatshrink", "-e", "-w8", "-l4"], input=data_bin
-        )
-        assert data_encoded_str
-        data_enc = bytearray(data_encoded_str)
-        data_enc = bytearray([len(data_enc) & 0xFF, len(data_enc) >> 8]) + data_enc
-        # Use encoded data only if its lenght less than original, including header
-        if len(data_enc) < len(data_bin) + 1:
-            data = (
-                "{0x01,0x00,"
-                + "".join("0x{:02x},".format(byte) for byte in data_enc)
-                + "}"
-            )
-        else:
-            data = "{0x00," + data[1:]
-        return width, height, data
-
-    def _iconIsSupported(self, filename):
-        extension = filename.lower().split(".")[-1]
-        return extension in ICONS_SUPPORTED_FORMATS
-
     def icons(self):
         self.logger.debug(f"Converting icons")
-        icons_c = open(os.path.join(self.args.output_directory, "assets_icons.c"), "w")
-        icons_c.write(ICONS_TEMPLATE_C_HEADER)
+        icons_c = []
         icons = []
-        # Traverse icons tree, append image data to source file
-        for dirpath, dirnames, filenames in os.walk(self.args.input_directory):
+        sources = []
+        # Traverse icons tree, collect icons and their frames
+        for dirpath, entries in _walk_scandir(self.args.input_directory):
             self.logger.debug(f"Processing directory {dirpath}")
-            dirnames.sort()
-            filenames.sort()
-            if not filenames:
+            if not entries:
                 continue
-            if "frame_rate" in filenames:
+            frame_rate_entry = next(
+                (entry for entry in entries if entry.name == "frame_rate"), None
+            )
+            if frame_rate_entry:
                 self.logger.debug(f"Folder contatins animation")
                 icon_name = "A_" + os.path.split(dirpath)[1].replace("-", "_")
-                width = height = None
-                frame_count = 0
-                frame_rate = 0
-                frame_names = []
-                for filename in sorted(filenames):
-                    fullfilename = os.path.join(dirpath, filename)
-                    if filename == "frame_rate":
-                        frame_rate = int(open(fullfilename, "r").read().strip())
-                        continue
-                    elif not self._iconIsSupported(filename):
-                        continue
-                    self.logger.debug(f"Processing animation frame {filename}")
-                    temp_width, temp_height, data = self._icon2header(fullfilename)
-                    if width is None:
-                        width = temp_width
-                    if height is None:
-                        height = temp_height
-                    assert width == temp_width
-                    assert height == temp_height
-                    frame_name = f"_{icon_name}_{frame_count}"
-                    frame_names.append(frame_name)
-                    icons_c.write(
-                        ICONS_TEMPLATE_C_FRAME.format(name=frame_name, data=data)
-                    )
-                    frame_count += 1
+                with open(frame_rate_entry.path, "r") as f:
+                    frame_rate = int(f.read().strip())
+                frame_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.lower().endswith(ICONS_SUPPORTED_FORMATS)
+                ]
+                self.logger.debug(f"Animation has {len(frame_files)} frames")
                 assert frame_rate > 0
-                assert frame_count > 0
-                icons_c.write(
-                    ICONS_TEMPLATE_C_DATA.format(
-                        name=f"_{icon_name}", data=f'{{{",".join(frame_names)}}}'
-                    )
-                )
-                icons_c.write("\n")
-                icons.append((icon_name, width, height, frame_rate, frame_count))
+                assert len(frame_files) > 0
+                sources.append((icon_name, frame_rate, frame_files))
             else:
                 # process icons
-                for filename in filenames:
-                    if not self._iconIsSupported(filename):
+                for entry in entries:
+                    if not entry.name.lower().endswith(ICONS_SUPPORTED_FORMATS):
                         continue
-                    self.logger.debug(f"Processing icon {filename}")
-                    icon_name = "I_" + "_".join(filename.split(".")[:-1]).replace(
+                    self.logger.debug(f"Processing icon {entry.name}")
+                    icon_name = "I_" + "_".join(entry.name.split(".")[:-1]).replace(
                         "-", "_"
                     )
-                    fullfilename = os.path.join(dirpath, filename)
-                    width, height, data = self._icon2header(fullfilename)
-                    frame_name = f"_{icon_name}_0"
-                    icons_c.write(
-                        ICONS_TEMPLATE_C_FRAME.format(name=frame_name, data=data)
-                    )
-                    icons_c.write(
-                        ICONS_TEMPLATE_C_DATA.format(
-                            name=f"_{icon_name}", data=f"{{{frame_name}}}"
-                        )
-                    )
-                    icons_c.write("\n")
-                    icons.append((icon_name, width, height, 0, 1))
-        # Create array of images:
-        self.logger.debug(f"Finalizing source file")
-        for name, width, height, frame_rate, frame_count in icons:
-            icons_c.write(
-                ICONS_TEMPLATE_C_ICONS.format(
-                    name=name,
-                    width=width,
-                    height=height,
-                    frame_rate=frame_rate,
-                    frame_count=frame_count,
-                )
-            )
-        icons_c.write("\n")
-        # Create Public Header
-        self.logger.debug(f"Creating header")
-        icons_h = open(os.path.join(self.args.output_directory, "assets_icons.h"), "w")
-        icons_h.write(ICONS_TEMPLATE_H_HEADER)
+                    sources.append((icon_name, 0, [entry.path]))
+        # Load conversion cache, keyed by frame file content hash
+        cache_path = os.path.join(self.args.output_directory, ICONS_CACHE_FILENAME)
+        cache = {}
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                self.logger.warning(f"Icons cache is broken, rebuilding all icons")
+        # Library upgrades may change the output too
+        cache_version = f"{ICONS_CACHE_VERSION}:pillow-{PIL.__version__}:heatshrink2-{heatshrink2.__version__}"
+        keys = []
+        for _, _, frame_files in sources:
+            for filename in frame_files:
+                with open(filename, "rb") as f:
+                    key = hashlib.sha256(cache_version.encode())
+                    key.update(f.read())
+                    keys.append((key.hexdigest(), filename))
+        # Convert changed frames in parallel, pool.map keeps the order
+        misses = {key: filename for key, filename in keys if key not in cache}
+        self.logger.debug(f"Converting {len(misses)} of {len(keys)} frames")
+        if misses:
+            with multiprocessing.Pool() as pool:
+                converted = pool.map(_icon2frame, list(misses.values()))
+            cache.update(zip(misses, converted))
+        frames = iter([cache[key] for key, _ in keys])
+        # Append image data to blob, reference frames by offset in source file
+        blob = bytearray()
+        for icon_name, frame_rate, frame_files in sources:
+            icon_frames = [next(frames) for _ in frame_files]
+            # All frames must have the same size as the first one
+            width, height, _ = icon_frames[0]
+            assert all(w == width and h == height for w, h, _ in icon_frames)
+            frame_offsets = []
+            for _, _, data in icon_frames:
+                frame_offsets.append(f"{ICONS_BLOB_SYMBOL}+{len(blob)}")
+                blob += bytes.fromhex(data)
+                blob += bytes(-len(blob) % ICONS_BLOB_ALIGN)
+            icons_c.append(_fmt_data(f"_{icon_name}", f'{{{",".join(frame_offsets)}}}'))
+            icons.append((icon_name, width, height, frame_rate, len(frame_files)))
+        # Create array of images and Public Header
+        self.logger.debug(f"Finalizing source file and creating header")
+        icons_h = [ICONS_TEMPLATE_H_HEADER]
         for name, width, height, frame_rate, frame_count in icons:
-            icons_h.write(ICONS_TEMPLATE_H_ICON_NAME.format(name=name))
+            icons_c.append(_fmt_icon(name, width, height, frame_rate, frame_count))
+            icons_h.append(_fmt_icon_name(name))
+        icons_c.append("\n")
+        with open(
+            os.path.join(self.args.output_directory, ICONS_BLOB_FILENAME), "wb"
+        ) as f:
+            f.write(blob)
+        icons_c.insert(
+            0,
+            ICONS_TEMPLATE_C_HEADER.format(
+                filename=ICONS_BLOB_FILENAME,
+                blob_hash=hashlib.sha256(blob).hexdigest(),
+                symbol=ICONS_BLOB_SYMBOL,
+                align=ICONS_BLOB_ALIGN,
+            ),
+        )
+        with open(os.path.join(self.args.output_directory, "assets_icons.c"), "w") as f:
+            f.write("".join(icons_c))
+        with open(os.path.join(self.args.output_directory, "assets_icons.h"), "w") as f:
+            f.write("".join(icons_h))
+        # Store only entries in use, so cache doesn't grow with stale frames
+        # Write to temporary file first, interrupted build must not break cache
+        with open(cache_path + ".tmp", "w") as f:
+            json.dump({key: cache[key] for key, _ in keys}, f)
+        os.replace(cache_path + ".tmp", cache_path)
         self.logger.debug(f"Done")
         return 0
 
@@ -1,10 +1,11 @@
 import logging
 import argparse
-import subprocess
-import io
 import os
 import sys
 
+import heatshrink2
+from PIL import Image as PILImage
+
 ICONS_SUPPORTED_FORMATS = ["png"]
 
 
@@ -15,8 +16,8 @@ class Image:
         self.data = data
 
     def write(self, filename):
-        file = open(filename, "wb")
-        file.write(self.data)
+        with open(filename, "wb") as file:
+            file.write(self.data)
 
 
 def is_file_an_icon(filename):
@@ -25,21 +26,14 @@ def is_file_an_icon(filename):
 
 
 def file2image(file):
-    output = subprocess.check_output(["convert", file, "xbm:-"])
-    assert output
-
-    # Extract data from text
-    f = io.StringIO(output.decode().strip())
-    width = int(f.readline().strip().split(" ")[2])
-    height = int(f.readline().strip().split(" ")[2])
-    data = f.read().strip().replace("\n", "").replace(" ", "").split("=")[1][:-1]
-    data_str = data[1:-1].replace(",", " ").replace("0x", "")
-
-    data_bin = bytearray.fromhex(data_str)
+    # Same bits ImageMagick xbm output had: 1 is black, leftmost pixel in LSB
+    image = PILImage.open(file).convert("1", dither=PILImage.NONE)
+    width, height = image.size
+    data_bin = bytearray(image.tobytes("raw", "1;IR"))
 
     # Encode icon data with LZSS
-    data_encoded_str = subprocess.check_output(
-        ["heatshrink", "-e", "-w8", "-l4"], input=data_bin
+    data_encoded_str = heatshrink2.compress(
+        bytes(data_bin), window_sz2=8, lookahead_sz2=4
     )
 
     assert data_encoded_str